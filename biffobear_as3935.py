@@ -38,36 +38,98 @@ import adafruit_bus_device.i2c_device as i2c_dev
 __version__ = "0.0.0-auto.0"
 __repo__ = "https://github.com/BiffoBear/Biffobear_CircuitPython_AS3935.git"
 
-# Data structure for storing the sensor register details
-_Register = namedtuple("Register", ["addr", "offset", "mask"])
-
-# Global buffer for bus data and address
-_BUFFER = bytearray(2)
+# Module level constants are folded in by the MicroPython compiler, unlike the class
+# attributes which are looked up at run time, so use these on the bus access paths
+_ADDR_MASK = const(0x3F)  # Clears bits 15 and 14 - SPI write
+_READ_MODE = const(0x40)  # Sets bits 15 and 14 to 01 - SPI read
+_BYTE_MASK = const(0xFF)
 
-
-def _reg_value_from_choices(value, choices):
-    """Index of a value."""
-    # Returns the index of a value in an iterable
+# Data structure for storing the sensor register details
+_Register = namedtuple(
+    "Register", ["addr", "offset", "mask", "read_addr", "write_addr", "inv_mask"]
+)
+
+# Data structure for returning the details of an event from a single read
+_Event = namedtuple("Event", ["interrupt_status", "energy", "distance"])
+
+
+def _make_register(addr, offset, mask):
+    """Register details with the SPI read and write addresses and inverted mask
+    precomputed."""
+    # Set bits 15 and 14 of the read address to 01 - read, and the write address to 00
+    write_addr = addr & _ADDR_MASK
+    return _Register(
+        addr, offset, mask, write_addr | _READ_MODE, write_addr, ~mask & _BYTE_MASK
+    )
+
+
+# AS3935 registers:
+# Defined at module level so that the methods load them as globals, rather than looking
+# them up on the instance and then the class
+
+# DISP_FLAGS combines DISP_LCO, DISP_SRCO and DISP_TRCO into a 3 bit register
+# DISP_LCO - Display antenna frequency to interrupt pin
+# DISP_SRCO - Display SRCO clock frequency to interrupt pin
+# DISP_TRCO - Display TRCO clock frequency to interrupt pin
+# SCRO_CALIB and TRCO_CALIB combine the XXXX-CALIB_DONE and XXXX-CALIB-NOK regs into 2 bit regs
+# XXXX_CALIB_DONE - Calibration completed successfully
+# XXXX_CALIB_NOK - Calibration completed unsuccessfully
+
+# _REGISTER_NAME_REG = _make_register(address, offset, mask)
+_PWD_REG = _make_register(0x00, 0x00, 0x01)  # Sensor power down state
+_AFE_GB_REG = _make_register(0x00, 0x01, 0x3E)  # AFE gain boost
+_WDTH_REG = _make_register(0x01, 0x00, 0x0F)  # Watchdog threshold
+_NF_LEV_REG = _make_register(0x01, 0x04, 0x70)  # Noise floor level
+_SREJ_REG = _make_register(0x02, 0x00, 0x0F)  # Spike rejection
+_MIN_NUM_LIGH_REG = _make_register(0x02, 0x04, 0x30)  # Minimum number of lightning
+_CL_STAT_REG = _make_register(0x02, 0x06, 0x40)  # Clear statistics
+_INT_REG = _make_register(0x03, 0x00, 0x0F)  # Interrupt
+_MASK_DIST_REG = _make_register(0x03, 0x05, 0x20)  # Mask disturber
+_LCO_FDIV_REG = _make_register(0x03, 0x06, 0xC0)  # Frequency divisor for antenna tuning
+_S_LIG_L_REG = _make_register(0x04, 0x00, 0xFF)  # Energy of single lightning LSBYTE
+_S_LIG_M_REG = _make_register(0x05, 0x00, 0xFF)  # Energy of single lightning MSBYTE
+_S_LIG_MM_REG = _make_register(0x06, 0x00, 0x1F)  # Energy of single lightning MMSBYTE
+_DISTANCE_REG = _make_register(0x07, 0x00, 0x3F)  # Distance estimation
+_TUN_CAP_REG = _make_register(0x08, 0x00, 0x0F)  # Internal tuning capacitance
+_DISP_FLAGS_REG = _make_register(
+    0x08, 0x05, 0xE0
+)  # Display flags for output to interrupt pin
+_TRCO_CALIB_REG = _make_register(0x3A, 0x06, 0xC0)  # TRCO calibration result
+_SRCO_CALIB_REG = _make_register(0x3B, 0x06, 0xC0)  # SRCO calibration result
+_PRESET_DEFAULT_REG = _make_register(
+    0x3C, 0x00, 0xFF
+)  # Set this to 0x96 to reset the sensor
+_CALIB_RCO_REG = _make_register(
+    0x3D, 0x00, 0xFF
+)  # Set this to 0x96 to calibrate the clocks
+
+
+def _reg_value_from_choices(value, choice_map, error_message=None):
+    """Register value for a choice. choice_map must be a dict of {choice: register value},
+    not a sequence of the choices."""
+    # Pass a prebuilt error_message for fixed choices to avoid building the string when a
+    # bad value is given.
     try:
-        return choices.index(value)
-    except ValueError as error:
-        raise ValueError(
-            "Select a value from %s" % ", ".join([str(x) for x in choices])
-        ) from error
+        return choice_map[value]
+    except (KeyError, TypeError):
+        # TypeError is raised for unhashable values, e.g. lists
+        pass
+    if error_message is None:
+        error_message = "Select a value from %s" % ", ".join(
+            [str(x) for x in choice_map]
+        )
+    raise ValueError(error_message)
 
 
-def _value_is_in_range(value, *, lo_limit, hi_limit):
+def _value_is_in_range(value, lo_limit, hi_limit):
     """Check value is in range."""
-    try:
-        assert isinstance(value, int)
-    except AssertionError as error:
-        raise TypeError("Value must be an integer") from error
-    try:
-        assert lo_limit <= value <= hi_limit
-    except AssertionError as error:
+    # The setters pass the limits positionally, which is cheaper to call on MicroPython
+    if not isinstance(value, int):
+        raise TypeError("Value must be an integer")
+    if not lo_limit <= value <= hi_limit:
         raise ValueError(
             "Value must be in the range %s to %s, inclusive." % (lo_limit, hi_limit)
-        ) from error
+        )
     return value
 
 
@@ -81,18 +143,12 @@ class AS3935_Sensor:
     _0X03 = const(0x03)
     _0X04 = const(0x04)
     _0X05 = const(0x05)
-    _0X06 = const(0x06)
-    _0X07 = const(0x07)
     _0X08 = const(0x08)
-    _0X0B = const(0x0B)
-    _0X0F = const(0x0F)
     _0X10 = const(0x10)
     _0X12 = const(0x12)
     _0X20 = const(0x20)
     _0X3F = const(0x3F)
     _0X40 = const(0x40)
-    _0XC0 = const(0xC0)
-    _0XFF = const(0xFF)
     # Constants to make register values human readable in the code
     DATA_PURGE = _0X00  # Distance recalculated after purging old data
     NOISE = _0X01  # INT_NH Noise level too high. Stays high while noise remains
@@ -103,50 +159,63 @@ class AS3935_Sensor:
     # Valid inputs for strike count threshold and frequency divisor registers
     _LIGHTNING_COUNT = (_0X01, _0X05, const(0x09), _0X10)
     _FREQ_DIVISOR = (_0X10, _0X20, _0X40, const(0x80))
-
-    # AS3935 registers:
-
-    # DISP_FLAGS combines DISP_LCO, DISP_SRCO and DISP_TRCO into a 3 bit register
-    # DISP_LCO - Display antenna frequency to interrupt pin
-    # DISP_SRCO - Display SRCO clock frequency to interrupt pin
-    # DISP_TRCO - Display TRCO clock frequency to interrupt pin
-    # SCRO_CALIB and TRCO_CALIB combine the XXXX-CALIB_DONE and XXXX-CALIB-NOK regs into 2 bit regs
-    # XXXX_CALIB_DONE - Calibration completed successfully
-    # XXXX_CALIB_NOK - Calibration completed unsuccessfully
-
-    # _REGISTER_NAME = _Register(address, offset, mask)
-    _PWD = _Register(_0X00, _0X00, _0X01)  # Sensor power down state
-    _AFE_GB = _Register(_0X00, _0X01, const(0x3E))  # AFE gain boost
-    _WDTH = _Register(_0X01, _0X00, _0X0F)  # Watchdog threshold
-    _NF_LEV = _Register(_0X01, _0X04, const(0x70))  # Noise floor level
-    _SREJ = _Register(_0X02, _0X00, _0X0F)  # Spike rejection
-    _MIN_NUM_LIGH = _Register(_0X02, _0X04, const(0x30))  # Minimum number of lightning
-    _CL_STAT = _Register(_0X02, _0X06, _0X40)  # Clear statistics
-    _INT = _Register(_0X03, _0X00, _0X0F)  # Interrupt
-    _MASK_DIST = _Register(_0X03, _0X05, _0X20)  # Mask disturber
-    _LCO_FDIV = _Register(_0X03, _0X06, _0XC0)  # Frequency divisor for antenna tuning
-    _S_LIG_L = _Register(_0X04, _0X00, _0XFF)  # Energy of single lightning LSBYTE
-    _S_LIG_M = _Register(_0X05, _0X00, _0XFF)  # Energy of single lightning MSBYTE
-    _S_LIG_MM = _Register(
-        _0X06, _0X00, const(0x1F)
-    )  # Energy of single lightning MMSBYTE
-    _DISTANCE = _Register(_0X07, _0X00, _0X3F)  # Distance estimation
-    _TUN_CAP = _Register(_0X08, _0X00, _0X0F)  # Internal tuning capacitance
-    _DISP_FLAGS = _Register(
-        _0X08, _0X05, const(0xE0)
-    )  # Display flags for output to interrupt pin
-    _TRCO_CALIB = _Register(const(0x3A), _0X06, _0XC0)  # TRCO calibration result
-    _SRCO_CALIB = _Register((0x3B), _0X06, _0XC0)  # SRCO calibration result
-    _PRESET_DEFAULT = _Register(
-        const(0x3C), _0X00, _0XFF
-    )  # Set this to 0x96 to reset the sensor
-    _CALIB_RCO = _Register(
-        const(0x3D), _0X00, _0XFF
-    )  # Set this to 0x96 to calibrate the clocks
+    _LIGHTNING_COUNT_ERROR = "Select a value from 1, 5, 9, 16"
+    _FREQ_DIVISOR_ERROR = "Select a value from 16, 32, 64, 128"
+    # Reverse lookups of the valid inputs, {input: register value}
+    _LIGHTNING_COUNT_MAP = {
+        value: index for index, value in enumerate(_LIGHTNING_COUNT)
+    }
+    _FREQ_DIVISOR_MAP = {value: index for index, value in enumerate(_FREQ_DIVISOR)}
+
+    # Register values for bool settings, indexed by the bool, i.e. (False, True)
+    _OFF_ON_0X01 = (_0X00, _0X01)
+    _OFF_ON_0X02 = (_0X00, _0X02)
+    _OFF_ON_0X04 = (_0X00, _0X04)
+
+    # CL_STAT bit values to toggle it high, low, high
+    _CL_STAT_PULSE = (_0X40, _0X00, _0X40)
+
+    # Addresses of the registers that only change when the driver writes to them. Reads
+    # of these are reused until the driver next writes to the sensor, so that several
+    # properties stored in the same byte share a single bus read. 0x02 is not cached
+    # because the sensor resets MIN_NUM_LIGH after it has been triggered
+    _CACHED_ADDRS = (_0X00, _0X01, _0X08)
+
+    # Wait between the interrupt pin going high and reading the interrupt register
+    _INT_DELAY = 0.0002
+    _INT_DELAY_NS = const(200_000)
+
+    # AS3935 registers, also available as class attributes
+    _PWD = _PWD_REG
+    _AFE_GB = _AFE_GB_REG
+    _WDTH = _WDTH_REG
+    _NF_LEV = _NF_LEV_REG
+    _SREJ = _SREJ_REG
+    _MIN_NUM_LIGH = _MIN_NUM_LIGH_REG
+    _CL_STAT = _CL_STAT_REG
+    _INT = _INT_REG
+    _MASK_DIST = _MASK_DIST_REG
+    _LCO_FDIV = _LCO_FDIV_REG
+    _S_LIG_L = _S_LIG_L_REG
+    _S_LIG_M = _S_LIG_M_REG
+    _S_LIG_MM = _S_LIG_MM_REG
+    _DISTANCE = _DISTANCE_REG
+    _TUN_CAP = _TUN_CAP_REG
+    _DISP_FLAGS = _DISP_FLAGS_REG
+    _TRCO_CALIB = _TRCO_CALIB_REG
+    _SRCO_CALIB = _SRCO_CALIB_REG
+    _PRESET_DEFAULT = _PRESET_DEFAULT_REG
+    _CALIB_RCO = _CALIB_RCO_REG
 
     def __init__(self, *, interrupt_pin):
         self._interrupt_pin = digitalio.DigitalInOut(interrupt_pin)
         self._interrupt_pin.direction = digitalio.Direction.INPUT
+        # Register bytes keyed by register address, cleared whenever the driver writes
+        self._reg_cache = {}
+        # Last known power_down state, None until it has been read or set
+        self._pwd_state = None
+        # Time in ns that interrupt_set first saw the interrupt pin high, None while it is low
+        self._int_pin_rise_time = None
         self._startup_checks()
 
     def _read_byte_in(self, register):
@@ -157,17 +226,45 @@ class AS3935_Sensor:
         """Write one byte to the selected register."""
         # Stub method for testing. Overridden when subclass instatiates class.
 
+    def _read_bytes_in(self, register, count):
+        """Read count bytes, starting from the selected address, into the burst buffer."""
+        # Stub method for testing. Overridden when subclass instatiates class.
+
     def _get_register(self, register):
         """Read the current register byte, mask and shift the value."""
-        return (self._read_byte_in(register) & register.mask) >> register.offset
+        return (self._read_cached_byte(register) & register.mask) >> register.offset
+
+    def _read_cached_byte(self, register):
+        """Read the register byte, reusing an earlier read of the same byte if the driver
+        hasn't written to the sensor since."""
+        addr = register.addr
+        if addr not in self._CACHED_ADDRS:
+            return self._read_byte_in(register)
+        register_byte = self._reg_cache.get(addr)
+        if register_byte is None:
+            # pylint: disable=assignment-from-no-return
+            register_byte = self._read_byte_in(register)
+            # pylint: enable=assignment-from-no-return
+            self._reg_cache[addr] = register_byte
+        return register_byte
 
     def _set_register(self, register, value):
         """Read the byte containing the register, mask in the new value and write out the byte."""
-        # pylint: disable=assignment-from-no-return
-        register_byte = self._read_byte_in(register)
-        # pylint: enable=assignment-from-no-return
-        register_byte &= ~register.mask
-        register_byte |= (value << register.offset) & self._0XFF
+        mask = register.mask
+        # Direct commands change other registers, so drop all the cached bytes on any write
+        self._reg_cache.clear()
+        if mask == _BYTE_MASK:
+            # The value fills the whole byte, so there is no need to read it first
+            register_byte = value
+        else:
+            # pylint: disable=assignment-from-no-return
+            register_byte = self._read_byte_in(register)
+            # pylint: enable=assignment-from-no-return
+            register_byte &= register.inv_mask
+            register_byte |= (value << register.offset) & mask
+        # The AS3935 returns unexpected 0x00s if transfers aren't spaced out, so the write
+        # takes its own pause. The bus is released between the read and the write so that
+        # it isn't held through the pause
         self._write_byte_out(register, register_byte)
 
     @property
@@ -176,30 +273,26 @@ class AS3935_Sensor:
         and False if the sensor is used outdoors.  Default is True.
         """
         # Register _AFE_GB is set to self._0X12 for Indoor mode and 0x0e for outdoor mode
-        if self._get_register(self._AFE_GB) == self._0X12:
-            return True
-        return False
+        return self._get_register(_AFE_GB_REG) == self._0X12
 
     @indoor.setter
     def indoor(self, value):
         assert isinstance(value, bool)
         if value:
-            self._set_register(self._AFE_GB, self._0X12)
+            self._set_register(_AFE_GB_REG, self._0X12)
         else:
-            self._set_register(self._AFE_GB, const(0x0E))
+            self._set_register(_AFE_GB_REG, const(0x0E))
 
     @property
     def watchdog(self):
         """int: Watchdog threshold in the range 0 - 10 (default is 2). Higher thresholds reduce
         triggers from disturbers but decrease sensitivity to lightning strikes.
         """
-        return self._get_register(self._WDTH)
+        return self._get_register(_WDTH_REG)
 
     @watchdog.setter
     def watchdog(self, value):
-        self._set_register(
-            self._WDTH, _value_is_in_range(value, lo_limit=0, hi_limit=10)
-        )
+        self._set_register(_WDTH_REG, _value_is_in_range(value, 0, 10))
 
     @property
     def noise_floor_limit(self):
@@ -207,73 +300,114 @@ class AS3935_Sensor:
         this threshold is exceeded, an interrupt is issued. Higher values allow operation with
         higher background noise but decrease sensitivity to lightning strikes.
         """
-        return self._get_register(self._NF_LEV)
+        return self._get_register(_NF_LEV_REG)
 
     @noise_floor_limit.setter
     def noise_floor_limit(self, value):
-        self._set_register(
-            self._NF_LEV, _value_is_in_range(value, lo_limit=0, hi_limit=7)
-        )
+        self._set_register(_NF_LEV_REG, _value_is_in_range(value, 0, 7))
 
     @property
     def spike_threshold(self):
         """int: Get or set the spike rejection threshold in the range 0 - 11 (default is 2). Higher
         values reduce false triggers but decrease sensitivity to lightning strikes.
         """
-        return self._get_register(self._SREJ)
+        return self._get_register(_SREJ_REG)
 
     @spike_threshold.setter
     def spike_threshold(self, value):
-        self._set_register(
-            self._SREJ, _value_is_in_range(value, lo_limit=0, hi_limit=11)
-        )
+        self._set_register(_SREJ_REG, _value_is_in_range(value, 0, 11))
 
-    @property
-    def energy(self):
+    def get_energy(self):
         """int: The calculated energy of the last lightning strike. This is a
         dimensionless number.
         """
-        mmsb = self._get_register(self._S_LIG_MM)
-        msb = self._get_register(self._S_LIG_M)
-        lsb = self._get_register(self._S_LIG_L)
-        return ((mmsb << self._0X10) | (msb << self._0X08) | lsb) & const(0x3FFFFF)
+        # The three energy registers are consecutive, so read them in a single burst
+        # pylint: disable=assignment-from-no-return
+        energy = self._read_bytes_in(_S_LIG_L_REG, self._0X03)
+        # pylint: enable=assignment-from-no-return
+        # Shift and OR rather than int.from_bytes(), as the burst buffer is longer than the
+        # energy registers and converting all of it would need a long int on MicroPython
+        return ((energy[2] & _S_LIG_MM_REG.mask) << 16) | (energy[1] << 8) | energy[0]
 
-    @property
-    def distance(self):
+    energy = property(get_energy)
+
+    def get_distance(self):
         """int: Estimated distance to the storm front (km). Returns None if storm front is out of
         range (> 40 km).
         """
-        distance = self._get_register(self._DISTANCE)
+        return self._distance_in_km(self._get_register(_DISTANCE_REG))
+
+    distance = property(get_distance)
+
+    def _distance_in_km(self, distance):
+        """Convert the DISTANCE register value to km."""
         if distance == self._0X3F:  # Storm out of range
             distance = None
         elif distance == self._0X01:  # Storm overhead
             distance = self._0X00
         return distance  # Distance in km
 
-    @property
-    def interrupt_status(self):
+    def get_interrupt_status(self):
         """int: Status of the interrupt register. These constants are defined as helpers:
         LIGHTNING, DISTURBER. NOISE, DATA_PURGE.
 
         Note: This register is automatically cleared by the sensor after it is read.
         """
+        self._wait_for_interrupt_register()
+        interrupt_status = self._get_register(_INT_REG)
+        # Reading the register clears the interrupt, so the next one must wait in full
+        self._int_pin_rise_time = None
+        return interrupt_status
+
+    interrupt_status = property(get_interrupt_status)
+
+    def _wait_for_interrupt_register(self):
+        """Wait until the interrupt register is ready to be read."""
         # Wait a minimum of 2 ms between the interrupt pin going high and reading the register
-        time.sleep(0.0002)
-        return self._get_register(self._INT)
+        # If interrupt_set has seen the pin go high, only wait for whatever time is left
+        delay = self._INT_DELAY
+        if self._int_pin_rise_time is not None:
+            elapsed = time.monotonic_ns() - self._int_pin_rise_time
+            delay = (self._INT_DELAY_NS - elapsed) / 1_000_000_000
+        if delay > 0:
+            time.sleep(delay)
+
+    def get_event(self):
+        """Read the interrupt status, energy and distance together. The registers are
+        consecutive, so this takes a single burst read rather than five register reads.
+
+        Returns a namedtuple with the fields interrupt_status, energy and distance. Each
+        field has the same value as the property of the same name.
+
+        Note: The interrupt register is automatically cleared by the sensor after it is read.
+        """
+        self._wait_for_interrupt_register()
+        # pylint: disable=assignment-from-no-return
+        event = self._read_bytes_in(_INT_REG, self._0X05)
+        # pylint: enable=assignment-from-no-return
+        # Reading the register clears the interrupt, so the next one must wait in full
+        self._int_pin_rise_time = None
+        mmsb = event[3] & _S_LIG_MM_REG.mask
+        energy = (mmsb << 16) | (event[2] << 8) | event[1]
+        return _Event(
+            event[0] & _INT_REG.mask,
+            energy,
+            self._distance_in_km(event[4] & _DISTANCE_REG.mask),
+        )
 
     @property
     def disturber_mask(self):
         """bool: Disturber mask. If the mask is True, disturber events do not
         cause interrupts. Default is False.
         """
-        return bool(self._get_register(self._MASK_DIST))
+        return bool(self._get_register(_MASK_DIST_REG))
 
     @disturber_mask.setter
     def disturber_mask(self, value):
         # Set the register value to self._0X01 to suppress disturber event interrupts
         # Set the register value to self._0X00 to allow disturber event interrupts
         assert isinstance(value, bool)
-        self._set_register(self._MASK_DIST, int(value))
+        self._set_register(_MASK_DIST_REG, self._OFF_ON_0X01[value])
 
     @property
     def strike_count_threshold(self):
@@ -284,27 +418,42 @@ class AS3935_Sensor:
         Threshold may be 1, 5, 9, or 16. Default is 1.
         """
         # Convert the register value to the threshold
-        return self._LIGHTNING_COUNT[self._get_register(self._MIN_NUM_LIGH)]
+        return self._LIGHTNING_COUNT[self._get_register(_MIN_NUM_LIGH_REG)]
 
     @strike_count_threshold.setter
     def strike_count_threshold(self, value):
         self._set_register(
-            self._MIN_NUM_LIGH, _reg_value_from_choices(value, self._LIGHTNING_COUNT)
+            _MIN_NUM_LIGH_REG,
+            _reg_value_from_choices(
+                value, self._LIGHTNING_COUNT_MAP, self._LIGHTNING_COUNT_ERROR
+            ),
         )
 
     def clear_stats(self):
         """Clear statistics from lightning distance emulation block. This resets the
         data used to calculate the distance to the storm front.
         """
-        self._set_register(self._CL_STAT, self._0X01)
-        self._set_register(self._CL_STAT, self._0X00)
-        self._set_register(self._CL_STAT, self._0X01)
+        # Toggle CL_STAT high, low, high
+        self._pulse_bit(_CL_STAT_REG, self._CL_STAT_PULSE)
+
+    def _pulse_bit(self, register, pattern):
+        """Write each of the pattern values to the register in turn."""
+        # The pattern values are already shifted into place. The other bits in the byte
+        # don't change, so read the byte once. Each write takes its own pause, as the
+        # AS3935 returns unexpected 0x00s if transfers aren't spaced out
+        self._reg_cache.clear()
+        # pylint: disable=assignment-from-no-return
+        register_byte = self._read_byte_in(register) & register.inv_mask
+        # pylint: enable=assignment-from-no-return
+        for bits in pattern:
+            self._write_byte_out(register, register_byte | bits)
 
     @property
     def power_down(self):
         """bool: Power status. If True, the unit is powered off although the SPI and I2C buses
         remain active."""
-        return bool(self._get_register(self._PWD))
+        self._pwd_state = bool(self._get_register(_PWD_REG))
+        return self._pwd_state
 
     @power_down.setter
     def power_down(self, value):
@@ -312,19 +461,24 @@ class AS3935_Sensor:
         # whether the chip is already powered down
         # If False check the current state. If the chip is already powered up, do nothing
         # otherwise, power up the chip then calibrate and check the clocks
+        # The current state is only read from the chip if the driver doesn't already know it
         assert isinstance(value, bool)  # Be specific because of Python's truthiness
         if value:
-            self._set_register(self._PWD, self._0X01)
-        elif self.power_down:
+            self._set_register(_PWD_REG, self._0X01)
+            self._pwd_state = True
+        elif self._pwd_state or (
+            self._pwd_state is None and self._get_register(_PWD_REG)
+        ):
             # Only do this if the power_down mode is already set as clocks get calibrated
-            self._set_register(self._PWD, self._0X00)
+            self._set_register(_PWD_REG, self._0X00)
+            self._pwd_state = False
             # RCO clocks need to be calibrated when powering back up from a power_down
             # Procedure as per AS3935 datasheet
             self.calibrate_clocks()
             self._check_clock_calibration()
-            self._set_register(self._DISP_FLAGS, self._0X02)
+            self._set_register(_DISP_FLAGS_REG, self._0X02)
             time.sleep(0.002)
-            self._set_register(self._DISP_FLAGS, self._0X00)
+            self._set_register(_DISP_FLAGS_REG, self._0X00)
 
     @property
     def freq_divisor(self):
@@ -334,12 +488,15 @@ class AS3935_Sensor:
         Value must be one of 16, 32, 64, or 128. Default is 16.
         """
         # Convert the register value to the divisor
-        return self._FREQ_DIVISOR[self._get_register(self._LCO_FDIV)]
+        return self._FREQ_DIVISOR[self._get_register(_LCO_FDIV_REG)]
 
     @freq_divisor.setter
     def freq_divisor(self, value):
         self._set_register(
-            self._LCO_FDIV, _reg_value_from_choices(value, self._FREQ_DIVISOR)
+            _LCO_FDIV_REG,
+            _reg_value_from_choices(
+                value, self._FREQ_DIVISOR_MAP, self._FREQ_DIVISOR_ERROR
+            ),
         )
 
     @property
@@ -347,21 +504,21 @@ class AS3935_Sensor:
         """bool: When True, the antenna resonant frequency is divided by the freq_divisor
         and output as a square wave on the interrupt pin. Default is False.
         """
-        return self._get_register(self._DISP_FLAGS) == 4
+        return self._get_register(_DISP_FLAGS_REG) == 4
 
     @output_antenna_freq.setter
     def output_antenna_freq(self, value):
         assert isinstance(value, bool)
         # Set the register value to self._0X04 to enable antenna tuning mode
         # Set the register value to self._0X00 to disable antenna tuning mode
-        self._set_register(self._DISP_FLAGS, int(value) << 2)
+        self._set_register(_DISP_FLAGS_REG, self._OFF_ON_0X04[value])
 
     @property
     def output_srco(self):
         """bool: When True, output the SRCO clock signal on the interrupt pin.
         Default is False.
         """
-        return self._get_register(self._DISP_FLAGS) == 2
+        return self._get_register(_DISP_FLAGS_REG) == 2
 
     @output_srco.setter
     def output_srco(self, value):
@@ -369,7 +526,7 @@ class AS3935_Sensor:
         # Set the register value to self._0X02 to output SRCO clock to the interrupt pin
         # Set the register value to self._0X00 to allow normal interrupt operation
         self._set_register(
-            self._DISP_FLAGS, int(value) << 1
+            _DISP_FLAGS_REG, self._OFF_ON_0X02[value]
         )  # True is self._0X02, False is self._0X00
 
     @property
@@ -377,7 +534,7 @@ class AS3935_Sensor:
         """bool: When True, output the TRCO clock signal on the interrupt pin.
         Default is False.
         """
-        return self._get_register(self._DISP_FLAGS) == 1
+        return self._get_register(_DISP_FLAGS_REG) == 1
 
     @output_trco.setter
     def output_trco(self, value):
@@ -385,7 +542,7 @@ class AS3935_Sensor:
         # Set the register value to self._0X01 to output SRCO clock to the interrupt pin
         # Set the register value to self._0X00 to allow normal interrupt operation
         self._set_register(
-            self._DISP_FLAGS, int(value)
+            _DISP_FLAGS_REG, self._OFF_ON_0X01[value]
         )  # True is self._0X01, False is self._0X00
 
     @property
@@ -397,13 +554,11 @@ class AS3935_Sensor:
         however, the capacitance is set in steps of 8 pF, so values less than 120
         will be rounded down to the nearest step. Default is 0.
         """
-        return self._get_register(self._TUN_CAP) * 8
+        return self._get_register(_TUN_CAP_REG) * 8
 
     @tuning_capacitance.setter
     def tuning_capacitance(self, value):
-        self._set_register(
-            self._TUN_CAP, _value_is_in_range(value, lo_limit=0, hi_limit=120) // 8
-        )
+        self._set_register(_TUN_CAP_REG, _value_is_in_range(value, 0, 120) // 8)
 
     def _check_clock_calibration(self):
         """Check clock calibration was successful."""
@@ -412,16 +567,30 @@ class AS3935_Sensor:
         # for success
         # Use a timeout in case the caliration register is never set (e.g. due to no comms
         # with the sensor)
-        start = time.monotonic()
+        # TRCO_CALIB and SRCO_CALIB are in consecutive registers, so read both in one burst
+        monotonic = time.monotonic
+        trco_calib = _TRCO_CALIB_REG
+        # Both results share the same field layout, so look up the mask and offset once
+        offset = trco_calib.offset
+        mask = trco_calib.mask
+        deadline = monotonic() + self._0X01
         trco_result, srco_result = self._0X00, self._0X00
+        # Each poll is a single locked transfer, so other devices can use a shared bus
+        # between polls
         while not (trco_result and srco_result):
-            if time.monotonic() - start > self._0X01:
+            if monotonic() > deadline:
                 raise OSError(
                     "Problem communicating with the sensor. Check your wiring."
                 )
-            trco_result = self._get_register(self._TRCO_CALIB)
-            srco_result = self._get_register(self._SRCO_CALIB)
-        if self._0X01 in [trco_result, srco_result]:
+            # pylint: disable=assignment-from-no-return
+            results = self._read_bytes_in(trco_calib, self._0X02)
+            # pylint: enable=assignment-from-no-return
+            trco_result = (results[0] & mask) >> offset
+            srco_result = (results[1] & mask) >> offset
+        # Compare directly rather than building a sequence of the results
+        # pylint: disable=consider-using-in
+        if trco_result == self._0X01 or srco_result == self._0X01:
+            # pylint: enable=consider-using-in
             raise RuntimeError("AS3935 RCO clock calibration failed.")
 
     def calibrate_clocks(self):
@@ -429,13 +598,15 @@ class AS3935_Sensor:
         the antenna, so adjust that to 500 KHz +/- 3.5 % before calibrating."""
         # Send the direct command to the CALIB_RCO register to start automatic RCO calibration
         # then check that the calibration has succeeded
-        self._set_register(self._CALIB_RCO, self.DIRECT_COMMAND)
+        self._set_register(_CALIB_RCO_REG, self.DIRECT_COMMAND)
         self._check_clock_calibration()
 
     def reset(self):
         """Reset all the settings to the manufacturer's defaults."""
         # Send the direct command to the PRESET_DEFAUTLT register to start reset settings
-        self._set_register(self._PRESET_DEFAULT, self.DIRECT_COMMAND)
+        self._set_register(_PRESET_DEFAULT_REG, self.DIRECT_COMMAND)
+        # The sensor is powered up by the reset
+        self._pwd_state = False
 
     @property
     def interrupt_set(self):
@@ -448,9 +619,21 @@ class AS3935_Sensor:
         """
         # Return None if the interrupt pin is set to output a clock or antenna frequency,
         # otherwise, return the state of the interrupt pin
-        if self._get_register(self._DISP_FLAGS):
+        if self._get_register(_DISP_FLAGS_REG):
             return None
-        return self._interrupt_pin.value
+        # Record when the pin is first seen high so interrupt_status doesn't wait needlessly.
+        # The time is cleared when the interrupt register is read
+        pin_value = self._interrupt_pin.value
+        if not pin_value:
+            self._int_pin_rise_time = None
+        elif self._int_pin_rise_time is None:
+            # time.monotonic() is too coarse to time the delay after a long uptime, so only
+            # record the time if time.monotonic_ns() is available. Builds without long
+            # integers don't have it, and interrupt_status then waits for the full delay
+            monotonic_ns = getattr(time, "monotonic_ns", None)
+            if monotonic_ns is not None:
+                self._int_pin_rise_time = monotonic_ns()
+        return pin_value
 
     def _startup_checks(self):
         """Check communication with the AS3935 and confirm clocks are calibrated."""
@@ -476,6 +659,11 @@ class AS3935_I2C(AS3935_Sensor):
 
     def __init__(self, i2c, address=const(0x03), *, interrupt_pin):
         self._bus = i2c_dev.I2CDevice(i2c, address)
+        # Buffers are allocated once per instance and reused for every transaction
+        # Buffer for bus data and address
+        self._buffer = bytearray(2)
+        # Buffer for multi-byte reads from consecutive registers
+        self._burst_buffer = bytearray(5)
         super().__init__(interrupt_pin=interrupt_pin)
 
     def _write_byte_out(self, register, data):
@@ -484,10 +672,10 @@ class AS3935_I2C(AS3935_Sensor):
         # AS3935 chip returns unexpected 0x00s intermittently
         # Short pause to space out consecutive calls
         time.sleep(0.01)
-        _BUFFER[0] = register.addr
-        _BUFFER[1] = data
+        self._buffer[0] = register.addr
+        self._buffer[1] = data
         with self._bus as bus:
-            bus.write(_BUFFER, end=2)
+            bus.write(self._buffer, end=2)
 
     def _read_byte_in(self, register):
         """Read one byte from the selected register."""
@@ -495,10 +683,61 @@ class AS3935_I2C(AS3935_Sensor):
         # AS3935 chip returns unexpected 0x00s intermittently
         # Short pause to space out consecutive calls
         time.sleep(0.01)
-        _BUFFER[0] = register.addr
+        self._buffer[0] = register.addr
         with self._bus as bus:
-            bus.write_then_readinto(_BUFFER, _BUFFER, out_end=1, in_end=1)
-        return _BUFFER[0]
+            bus.write_then_readinto(self._buffer, self._buffer, out_end=1, in_end=1)
+        return self._buffer[0]
+
+    def _read_bytes_in(self, register, count):
+        """Read count bytes, starting from the selected register, into the burst buffer."""
+        # Overrides AS3935._read_bytes_in to handle reading data from the I2C bus
+        # AS3935 chip returns unexpected 0x00s intermittently
+        # Short pause to space out consecutive calls
+        time.sleep(0.01)
+        self._buffer[0] = register.addr
+        # The AS3935 increments the register address after each byte is read
+        with self._bus as bus:
+            bus.write_then_readinto(
+                self._buffer, self._burst_buffer, out_end=1, in_end=count
+            )
+        return self._burst_buffer
+
+
+class _ExclusiveSPIDevice:
+    """Lightweight replacement for SPIDevice for a bus that is only used by AS3935 sensors.
+
+    SPIDevice configures the bus every time it is entered, which is a large part of the
+    cost of a two byte transfer. As no other drivers use this bus, it only needs to be
+    configured again when a different AS3935 on the same bus has used it. Every AS3935 on
+    the bus must use this class, as SPIDevice reconfigures the bus without updating _owner.
+    """
+
+    # The instance that last configured the bus
+    _owner = None
+
+    def __init__(self, spi, chip_select, *, baudrate, polarity, phase):
+        self._spi = spi
+        self._chip_select = chip_select
+        self._baudrate = baudrate
+        self._polarity = polarity
+        self._phase = phase
+        self._chip_select.switch_to_output(value=True)
+
+    def __enter__(self):
+        while not self._spi.try_lock():
+            time.sleep(0)
+        if _ExclusiveSPIDevice._owner is not self:
+            self._spi.configure(
+                baudrate=self._baudrate, polarity=self._polarity, phase=self._phase
+            )
+            _ExclusiveSPIDevice._owner = self
+        self._chip_select.value = False
+        return self._spi
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._chip_select.value = True
+        self._spi.unlock()
+        return False
 
 
 class AS3935(AS3935_Sensor):
@@ -513,12 +752,31 @@ class AS3935(AS3935_Sensor):
         that CircuitPython currently does not support interrupts, but the line is held high
         for at least one second per event, so it may be polled. Some single board computers,
         e.g. the Raspberry Pi, do support interrupts.
+    :param bool exclusive_bus: Set to True if no devices other than AS3935 sensors are
+        connected to the SPI bus. The bus is then only configured when it is first used,
+        rather than before every transfer. Every AS3935 on the bus must then be created
+        with exclusive_bus=True. Default is False.
     """
 
-    def __init__(self, spi, cs_pin, baudrate=1_000_000, *, interrupt_pin):
-        self._bus = spi_dev.SPIDevice(
-            spi, digitalio.DigitalInOut(cs_pin), baudrate=baudrate, polarity=1, phase=0
-        )
+    def __init__(
+        self, spi, cs_pin, baudrate=1_000_000, *, interrupt_pin, exclusive_bus=False
+    ):
+        cs = digitalio.DigitalInOut(cs_pin)
+        if exclusive_bus:
+            self._bus = _ExclusiveSPIDevice(
+                spi, cs, baudrate=baudrate, polarity=1, phase=0
+            )
+        else:
+            self._bus = spi_dev.SPIDevice(
+                spi, cs, baudrate=baudrate, polarity=1, phase=0
+            )
+        # Buffers are allocated once per instance and reused for every transaction
+        # Buffer for bus data and address
+        self._buffer = bytearray(2)
+        # Buffer for the bytes clocked in during a read
+        self._read_buffer = bytearray(2)
+        # Buffer for multi-byte reads from consecutive registers
+        self._burst_buffer = bytearray(5)
         super().__init__(interrupt_pin=interrupt_pin)
 
     def _write_byte_out(self, register, data):
@@ -526,20 +784,31 @@ class AS3935(AS3935_Sensor):
         # AS3935 chip returns unexpected 0x00s intermittently
         # Short pause to space out consecutive calls
         time.sleep(0.01)
-        _BUFFER[0] = register.addr & self._0X3F  # Set bits 15 and 14 to 00 - write
-        _BUFFER[1] = data
+        self._buffer[0] = register.write_addr  # Bits 15 and 14 set to 00 - write
+        self._buffer[1] = data
         with self._bus as bus:
-            bus.write(_BUFFER, end=2)
+            bus.write(self._buffer, end=2)
 
     def _read_byte_in(self, register):
         """Read one byte from the selected address."""
         # AS3935 chip returns unexpected 0x00s intermittently
         # Short pause to space out consecutive calls
         time.sleep(0.01)
-        _BUFFER[0] = (register.addr & const(0x3F)) | const(
-            0x40
-        )  # Set bits 15 and 14 to 01 - read
+        self._buffer[0] = register.read_addr  # Bits 15 and 14 set to 01 - read
+        self._buffer[1] = 0x00
+        # The register byte is clocked in while the second byte is clocked out
+        with self._bus as bus:
+            bus.write_readinto(self._buffer, self._read_buffer)
+        return self._read_buffer[1]
+
+    def _read_bytes_in(self, register, count):
+        """Read count bytes, starting from the selected address, into the burst buffer."""
+        # AS3935 chip returns unexpected 0x00s intermittently
+        # Short pause to space out consecutive calls
+        time.sleep(0.01)
+        self._buffer[0] = register.read_addr  # Bits 15 and 14 set to 01 - read
+        # The AS3935 increments the register address after each byte is read
         with self._bus as bus:
-            bus.write(_BUFFER, end=1)
-            bus.readinto(_BUFFER, end=1)
-            return _BUFFER[0]
+            bus.write(self._buffer, end=1)
+            bus.readinto(self._burst_buffer, end=count)
+        return self._burst_buffer
@@ -26,6 +26,11 @@ def set_reg(mocker):
     return mocker.patch.object(as3935.AS3935_Sensor, "_set_register", autospec=True)
 
 
+@pytest.fixture
+def read_bytes(mocker):
+    return mocker.patch.object(as3935.AS3935_Sensor, "_read_bytes_in", autospec=True)
+
+
 @pytest.fixture
 def test_device(mocker):
     # Returns an instance of the AS3935 driver with SDIDevice patched.
@@ -37,7 +42,7 @@ def test_device(mocker):
 @pytest.fixture
 def test_register():
     # Returns an instance of the Register named tuple
-    return as3935._Register(0x01, 0x04, 0b0111_0000)
+    return as3935._make_register(0x01, 0x04, 0b0111_0000)
 
 
 def test_register_onstants():
@@ -47,23 +52,20 @@ def test_register_onstants():
     assert as3935.AS3935_Sensor._0X03 == 0x03
     assert as3935.AS3935_Sensor._0X04 == 0x04
     assert as3935.AS3935_Sensor._0X05 == 0x05
-    assert as3935.AS3935_Sensor._0X06 == 0x06
-    assert as3935.AS3935_Sensor._0X07 == 0x07
     assert as3935.AS3935_Sensor._0X08 == 0x08
-    assert as3935.AS3935_Sensor._0X0B == 0x0B
-    assert as3935.AS3935_Sensor._0X0F == 0x0F
     assert as3935.AS3935_Sensor._0X10 == 0x10
     assert as3935.AS3935_Sensor._0X12 == 0x12
     assert as3935.AS3935_Sensor._0X20 == 0x20
     assert as3935.AS3935_Sensor._0X3F == 0x3F
     assert as3935.AS3935_Sensor._0X40 == 0x40
-    assert as3935.AS3935_Sensor._0XC0 == 0xC0
-    assert as3935.AS3935_Sensor._0XFF == 0xFF
 
 
 def test_other_constants():
     assert as3935.AS3935_Sensor._LIGHTNING_COUNT == (1, 5, 9, 16)
     assert as3935.AS3935_Sensor._FREQ_DIVISOR == (16, 32, 64, 128)
+    assert as3935.AS3935_Sensor._OFF_ON_0X01 == (0x00, 0x01)
+    assert as3935.AS3935_Sensor._OFF_ON_0X02 == (0x00, 0x02)
+    assert as3935.AS3935_Sensor._OFF_ON_0X04 == (0x00, 0x04)
     # 0x00 - Distance recalculated after purging old data.
     assert as3935.AS3935_Sensor.DATA_PURGE == 0x00
     # 0x01 - INT_NH Noise level too high. Stays high while noise remains.
@@ -76,11 +78,6 @@ def test_other_constants():
     assert as3935.AS3935_Sensor.DIRECT_COMMAND == 0x96
 
 
-def test_address_and_data_command_buffers():
-    assert isinstance(as3935._BUFFER, bytearray)
-    assert len(as3935._BUFFER) == 2
-
-
 @pytest.mark.parametrize(
     "register, addr, offset, mask",
     [
@@ -111,6 +108,21 @@ def test_register_settings(register, addr, offset, mask):
     assert register.addr == addr
     assert register.offset == offset
     assert register.mask == mask
+    assert register.read_addr == addr | 0x40
+    assert register.write_addr == addr
+    assert register.inv_mask == 0xFF ^ mask
+
+
+def test_class_registers_are_the_module_registers():
+    # The methods use the module level registers, so the class attributes must match them
+    register_names = [
+        name
+        for name in dir(as3935)
+        if name.endswith("_REG") and isinstance(getattr(as3935, name), tuple)
+    ]
+    assert len(register_names) == 20
+    for name in register_names:
+        assert getattr(as3935.AS3935_Sensor, name[:-4]) is getattr(as3935, name)
 
 
 def test_init_method_called_with_correct_args(mocker):
@@ -163,6 +175,15 @@ def test_write_byte_out_has_same_signature_as_subclasses():
     )
 
 
+def test_read_bytes_in_has_same_signature_as_subclasses():
+    assert inspect.signature(as3935.AS3935_Sensor._read_bytes_in) == inspect.signature(
+        as3935.AS3935_I2C._read_bytes_in
+    )
+    assert inspect.signature(as3935.AS3935_Sensor._read_bytes_in) == inspect.signature(
+        as3935.AS3935._read_bytes_in
+    )
+
+
 @pytest.mark.parametrize(
     "register_byte, return_byte", [(0xFF, 0x07), (0x00, 0x00), (0x55, 0x05)]
 )
@@ -175,6 +196,71 @@ def test_get_register(mocker, test_device, test_register, register_byte, return_
     assert result == return_byte
 
 
+def test_get_register_reuses_reads_of_cached_registers(
+    mocker, test_device, test_register
+):
+    mock_read_byte_in = mocker.patch.object(
+        as3935.AS3935_Sensor, "_read_byte_in", autospec=True, return_value=0x55
+    )
+    assert test_register.addr in as3935.AS3935_Sensor._CACHED_ADDRS
+    # First read goes to the bus, later reads are served from the cache
+    assert test_device._get_register(test_register) == 0x05
+    assert test_device._get_register(test_register) == 0x05
+    mock_read_byte_in.assert_called_once_with(test_device, test_register)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "indoor",
+        "watchdog",
+        "noise_floor_limit",
+        "power_down",
+        "tuning_capacitance",
+        "output_antenna_freq",
+        "output_srco",
+        "output_trco",
+        "interrupt_set",
+    ],
+)
+def test_cached_getters_work_without_monotonic_ns(
+    mocker, monkeypatch, test_device, name
+):
+    # CircuitPython builds without long integers don't have time.monotonic_ns()
+    monkeypatch.delattr(as3935.time, "monotonic_ns", raising=False)
+    mocker.patch.object(
+        as3935.AS3935_Sensor, "_read_byte_in", autospec=True, return_value=0x00
+    )
+    getattr(test_device, name)
+    getattr(test_device, name)
+
+
+def test_get_register_always_reads_registers_changed_by_the_sensor(mocker, test_device):
+    mock_read_byte_in = mocker.patch.object(
+        as3935.AS3935_Sensor, "_read_byte_in", autospec=True, return_value=0x08
+    )
+    # The interrupt register is cleared by the sensor each time it is read
+    test_device._get_register(as3935.AS3935_Sensor._INT)
+    test_device._get_register(as3935.AS3935_Sensor._INT)
+    assert mock_read_byte_in.call_count == 2
+    # MIN_NUM_LIGH is reset by the sensor after it has been triggered
+    test_device._get_register(as3935.AS3935_Sensor._MIN_NUM_LIGH)
+    test_device._get_register(as3935.AS3935_Sensor._MIN_NUM_LIGH)
+    assert mock_read_byte_in.call_count == 4
+
+
+def test_set_register_clears_cached_reads(mocker, test_device, test_register):
+    mock_read_byte_in = mocker.patch.object(
+        as3935.AS3935_Sensor, "_read_byte_in", autospec=True, return_value=0x55
+    )
+    mocker.patch.object(as3935.AS3935_Sensor, "_write_byte_out", autospec=True)
+    test_device._get_register(test_register)
+    test_device._set_register(test_register, 0x01)
+    test_device._get_register(test_register)
+    # Read by the first get, by the set and then again by the second get
+    assert mock_read_byte_in.call_count == 3
+
+
 @pytest.mark.parametrize(
     "byte_in, register_value, byte_out",
     [(0xFF, 0x00, 0x8F), (0x00, 0x07, 0x70), (0x55, 0x05, 0x55)],
@@ -193,15 +279,68 @@ def test_set_register(
     mock_write_byte_out.assert_called_once_with(test_device, test_register, byte_out)
 
 
+@pytest.mark.parametrize(
+    "register",
+    [as3935.AS3935_Sensor._PRESET_DEFAULT, as3935.AS3935_Sensor._CALIB_RCO],
+)
+def test_set_register_does_not_read_registers_that_fill_a_byte(
+    mocker, test_device, register
+):
+    mock_read_byte_in = mocker.patch.object(
+        as3935.AS3935_Sensor, "_read_byte_in", autospec=True
+    )
+    mock_write_byte_out = mocker.patch.object(
+        as3935.AS3935_Sensor, "_write_byte_out", autospec=True
+    )
+    test_device._set_register(register, 0x96)
+    mock_read_byte_in.assert_not_called()
+    mock_write_byte_out.assert_called_once_with(test_device, register, 0x96)
+
+
 @pytest.mark.parametrize("value, register_value", [(2, 0), (3, 1), (5, 2)])
 def test_reg_value_from_choices_returns_correct_value(value, register_value):
-    assert as3935._reg_value_from_choices(value, (2, 3, 5)) == register_value
+    assert as3935._reg_value_from_choices(value, {2: 0, 3: 1, 5: 2}) == register_value
 
 
-@pytest.mark.parametrize("bad_arg", [1, "x", 1.1])
+@pytest.mark.parametrize("bad_arg", [1, "x", 1.1, [2], {2: 0}])
 def test_reg_value_from_choices_handles_invalid_args(bad_arg):
     with pytest.raises(ValueError):
-        as3935._reg_value_from_choices(bad_arg, (2, 3, 5))
+        as3935._reg_value_from_choices(bad_arg, {2: 0, 3: 1, 5: 2})
+
+
+def test_reg_value_from_choices_uses_given_error_message():
+    with pytest.raises(ValueError, match="^Pick 2 or 3$"):
+        as3935._reg_value_from_choices(4, {2: 0, 3: 1}, "Pick 2 or 3")
+
+
+@pytest.mark.parametrize(
+    "choices, choices_map",
+    [
+        (
+            as3935.AS3935_Sensor._LIGHTNING_COUNT,
+            as3935.AS3935_Sensor._LIGHTNING_COUNT_MAP,
+        ),
+        (as3935.AS3935_Sensor._FREQ_DIVISOR, as3935.AS3935_Sensor._FREQ_DIVISOR_MAP),
+    ],
+)
+def test_choice_maps_match_choices(choices, choices_map):
+    assert choices_map == {value: index for index, value in enumerate(choices)}
+
+
+@pytest.mark.parametrize(
+    "choices, error_message",
+    [
+        (
+            as3935.AS3935_Sensor._LIGHTNING_COUNT,
+            as3935.AS3935_Sensor._LIGHTNING_COUNT_ERROR,
+        ),
+        (as3935.AS3935_Sensor._FREQ_DIVISOR, as3935.AS3935_Sensor._FREQ_DIVISOR_ERROR),
+    ],
+)
+def test_prebuilt_choice_error_messages_match_choices(choices, error_message):
+    assert error_message == "Select a value from %s" % ", ".join(
+        [str(x) for x in choices]
+    )
 
 
 @pytest.mark.parametrize("value", [0, 5, 8])
@@ -292,16 +431,22 @@ def test_spike_threshold_setter(set_reg, test_device, value, out_of_range_value)
         test_device.spike_threshold = out_of_range_value
 
 
-def test_enery_getter(mocker, get_reg, test_device):
-    get_reg.side_effect = [0x06, 0x55, 0x44]
-    expected_calls = [
-        mocker.call(test_device, as3935.AS3935_Sensor._S_LIG_MM),
-        mocker.call(test_device, as3935.AS3935_Sensor._S_LIG_M),
-        mocker.call(test_device, as3935.AS3935_Sensor._S_LIG_L),
-    ]
-    assert test_device.energy == 0x065544
-    assert get_reg.call_count == 3
-    assert get_reg.call_args_list == expected_calls
+@pytest.mark.parametrize(
+    "register_bytes, value",
+    [((0x44, 0x55, 0x06), 0x065544), ((0xFF, 0xFF, 0xFF), 0x1FFFFF)],
+)
+def test_enery_getter(mocker, test_device, register_bytes, value):
+    # LSBYTE, MSBYTE and MMSBYTE are read in a single burst starting from _S_LIG_L
+    mock_read_bytes_in = mocker.patch.object(
+        as3935.AS3935_Sensor,
+        "_read_bytes_in",
+        autospec=True,
+        return_value=bytearray(register_bytes),
+    )
+    assert test_device.energy == value
+    mock_read_bytes_in.assert_called_once_with(
+        test_device, as3935.AS3935_Sensor._S_LIG_L, 3
+    )
 
 
 @pytest.mark.parametrize("register_value, value", [(0x01, 0), (0x11, 17), (0x3F, None)])
@@ -319,6 +464,95 @@ def test_interrupt_status_getter(get_reg, test_device, value):
     get_reg.assert_called_once_with(test_device, as3935.AS3935_Sensor._INT)
 
 
+@pytest.mark.parametrize(
+    "name, method",
+    [
+        ("interrupt_status", "get_interrupt_status"),
+        ("energy", "get_energy"),
+        ("distance", "get_distance"),
+    ],
+)
+def test_polled_properties_use_the_direct_methods(name, method):
+    # The properties are built from the methods so that either can be used
+    assert getattr(as3935.AS3935_Sensor, name).fget is getattr(
+        as3935.AS3935_Sensor, method
+    )
+
+
+@pytest.mark.parametrize(
+    "register_bytes, interrupt_status, energy, distance",
+    [
+        ((0xE8, 0x44, 0x55, 0x06, 0x11), 0x08, 0x065544, 17),
+        ((0x04, 0x00, 0x00, 0x00, 0x3F), 0x04, 0x000000, None),
+        ((0x01, 0xFF, 0xFF, 0xFF, 0x01), 0x01, 0x1FFFFF, 0),
+    ],
+)
+def test_get_event(
+    mocker, test_device, register_bytes, interrupt_status, energy, distance
+):
+    mock_read_bytes_in = mocker.patch.object(
+        as3935.AS3935_Sensor,
+        "_read_bytes_in",
+        autospec=True,
+        return_value=bytearray(register_bytes),
+    )
+    event = test_device.get_event()
+    # INT, S_LIG_L, S_LIG_M, S_LIG_MM and DISTANCE are read in a single burst
+    mock_read_bytes_in.assert_called_once_with(
+        test_device, as3935.AS3935_Sensor._INT, 5
+    )
+    assert event.interrupt_status == interrupt_status
+    assert event.energy == energy
+    assert event.distance == distance
+
+
+@pytest.mark.parametrize(
+    "rise_time, sleep_time",
+    [(None, 0.0002), (1_000_000_000_000, 0.0001), (999_000_000_000, None)],
+)
+def test_interrupt_status_only_waits_for_the_remaining_delay(
+    mocker, get_reg, test_device, rise_time, sleep_time
+):
+    mock_sleep = mocker.patch.object(as3935.time, "sleep")
+    mocker.patch.object(as3935.time, "monotonic_ns", return_value=1_000_000_100_000)
+    test_device._int_pin_rise_time = rise_time
+    test_device.interrupt_status
+    if sleep_time is None:
+        mock_sleep.assert_not_called()
+    else:
+        mock_sleep.assert_called_once_with(pytest.approx(sleep_time))
+
+
+@pytest.mark.parametrize("method", ["get_interrupt_status", "get_event"])
+def test_reading_the_interrupt_register_clears_the_pin_rise_time(
+    mocker, get_reg, test_device, method
+):
+    mocker.patch.object(
+        as3935.AS3935_Sensor,
+        "_read_bytes_in",
+        autospec=True,
+        return_value=bytearray(5),
+    )
+    mock_sleep = mocker.patch.object(as3935.time, "sleep")
+    mock_monotonic_ns = mocker.patch.object(
+        as3935.time, "monotonic_ns", return_value=100_000_000_000
+    )
+    mock_pin_value = PropertyMock(return_value=True)
+    type(test_device._interrupt_pin).value = mock_pin_value
+    get_reg.return_value = 0x00
+    # First event is seen and read after the delay has passed
+    test_device.interrupt_set
+    mock_monotonic_ns.return_value = 100_500_000_000
+    getattr(test_device, method)()
+    mock_sleep.assert_not_called()
+    assert test_device._int_pin_rise_time is None
+    # A second event raises the pin before interrupt_set sees it low
+    mock_monotonic_ns.return_value = 101_000_000_000
+    test_device.interrupt_set
+    getattr(test_device, method)()
+    mock_sleep.assert_called_once_with(pytest.approx(0.0002))
+
+
 @pytest.mark.parametrize("register_value, result", [(0x01, True), (0x00, False)])
 def test_disturber_mask_getter(get_reg, test_device, register_value, result):
     # If the register is set disturber events are ignored. If clear, disturbers cause interrupts.
@@ -366,15 +600,44 @@ def test_strike_count_threshold_setter(
         test_device.strike_count_threshold = out_of_range_value
 
 
-def test_clear_stats(mocker, set_reg, test_device):
+@pytest.mark.parametrize(
+    "byte_in, bytes_out", [(0x22, (0x62, 0x22, 0x62)), (0xFF, (0xFF, 0xBF, 0xFF))]
+)
+def test_clear_stats(mocker, test_device, byte_in, bytes_out):
+    mock_read_byte_in = mocker.patch.object(
+        as3935.AS3935_Sensor, "_read_byte_in", autospec=True, return_value=byte_in
+    )
+    mock_write_byte_out = mocker.patch.object(
+        as3935.AS3935_Sensor, "_write_byte_out", autospec=True
+    )
+    # CL_STAT is toggled high, low, high from a single read
     expected_calls = [
-        mocker.call(test_device, as3935.AS3935_Sensor._CL_STAT, 0x01),
-        mocker.call(test_device, as3935.AS3935_Sensor._CL_STAT, 0x00),
-        mocker.call(test_device, as3935.AS3935_Sensor._CL_STAT, 0x01),
+        mocker.call(test_device, as3935.AS3935_Sensor._CL_STAT, byte_out)
+        for byte_out in bytes_out
     ]
     test_device.clear_stats()
-    assert set_reg.call_count == 3
-    assert set_reg.call_args_list == expected_calls
+    mock_read_byte_in.assert_called_once_with(
+        test_device, as3935.AS3935_Sensor._CL_STAT
+    )
+    assert mock_write_byte_out.call_args_list == expected_calls
+
+
+def test_pulse_bit(mocker, test_device, test_register):
+    mock_read_byte_in = mocker.patch.object(
+        as3935.AS3935_Sensor, "_read_byte_in", autospec=True, return_value=0xFF
+    )
+    mock_write_byte_out = mocker.patch.object(
+        as3935.AS3935_Sensor, "_write_byte_out", autospec=True
+    )
+    test_device._reg_cache[0x01] = 0x00
+    # The other bits are kept and each pattern value is ORed in after clearing the field
+    test_device._pulse_bit(test_register, (0x70, 0x00, 0x10))
+    mock_read_byte_in.assert_called_once_with(test_device, test_register)
+    assert mock_write_byte_out.call_args_list == [
+        mocker.call(test_device, test_register, byte_out)
+        for byte_out in (0xFF, 0x8F, 0x9F)
+    ]
+    assert test_device._reg_cache == {}
 
 
 @pytest.mark.parametrize("register_value, result", [(0x01, True), (0x00, False)])
@@ -432,6 +695,39 @@ def test_power_down_setter_false_and_power_is_up(mocker, set_reg, get_reg, test_
     mock_calibrate_clocks.assert_not_called()
 
 
+@pytest.mark.parametrize("value", [True, False])
+def test_power_down_getter_and_setter_record_the_power_state(
+    set_reg, get_reg, test_device, value
+):
+    assert test_device._pwd_state is None
+    get_reg.return_value = int(value)
+    test_device.power_down
+    assert test_device._pwd_state is value
+    test_device.power_down = True
+    assert test_device._pwd_state is True
+
+
+def test_power_down_setter_false_uses_known_power_state(
+    mocker, set_reg, get_reg, test_device
+):
+    mocker.patch.object(as3935.AS3935_Sensor, "calibrate_clocks", autospec=True)
+    mocker.patch.object(as3935.AS3935_Sensor, "_check_clock_calibration", autospec=True)
+    mocker.patch.object(as3935.time, "sleep")
+    # Power known to be down, so power up without reading the register
+    test_device._pwd_state = True
+    test_device.power_down = False
+    get_reg.assert_not_called()
+    assert set_reg.call_args_list[0] == mocker.call(
+        test_device, as3935.AS3935_Sensor._PWD, 0x00
+    )
+    assert test_device._pwd_state is False
+    # Power known to be up, so do nothing
+    set_reg.reset_mock()
+    test_device.power_down = False
+    get_reg.assert_not_called()
+    set_reg.assert_not_called()
+
+
 def test_power_down_setter_raises_an_error_when_called_with_invalid_args(test_device):
     with pytest.raises(AssertionError):
         test_device.power_down = "1"
@@ -565,42 +861,40 @@ def test_calibrate_clocks_calls_correct_register_then_checks_calibration(
 
 
 def test_check_clock_calibration_waits_for_calibration_to_finish(
-    mocker, set_reg, get_reg, test_device
+    mocker, read_bytes, test_device
 ):
     # Calibration complete when TRCO_CALIB_DONE and SRCO_CALIB_DONE are set
-    get_reg.side_effect = [0x00, 0x00, 0x00, 0x02, 0x02, 0x02]
+    read_bytes.side_effect = [
+        bytearray([0x00, 0x00]),
+        bytearray([0x00, 0x80]),
+        bytearray([0x80, 0x80]),
+    ]
+    # Both calibration registers are read in a single burst for each poll
     expected_calls = [
-        mocker.call(test_device, as3935.AS3935_Sensor._TRCO_CALIB),
-        mocker.call(test_device, as3935.AS3935_Sensor._SRCO_CALIB),
-        mocker.call(test_device, as3935.AS3935_Sensor._TRCO_CALIB),
-        mocker.call(test_device, as3935.AS3935_Sensor._SRCO_CALIB),
-        mocker.call(test_device, as3935.AS3935_Sensor._TRCO_CALIB),
-        mocker.call(test_device, as3935.AS3935_Sensor._SRCO_CALIB),
+        mocker.call(test_device, as3935.AS3935_Sensor._TRCO_CALIB, 2),
+        mocker.call(test_device, as3935.AS3935_Sensor._TRCO_CALIB, 2),
+        mocker.call(test_device, as3935.AS3935_Sensor._TRCO_CALIB, 2),
     ]
     test_device._check_clock_calibration()
-    assert get_reg.call_args_list == expected_calls
+    assert read_bytes.call_args_list == expected_calls
 
 
-@pytest.mark.parametrize("side_effects", [[0x02, 0x01], [0x01, 0x02], [0x01, 0x01]])
+@pytest.mark.parametrize("side_effects", [[0x80, 0x40], [0x40, 0x80], [0x40, 0x40]])
 def test_check_clock_calibration_raises_exception_when_a_calibration_fails(
-    mocker, set_reg, get_reg, test_device, side_effects
+    mocker, read_bytes, test_device, side_effects
 ):
     # TRCO_CALIB_NOK and SRCO_CALIB_NOK are set if the respective calibration failed
-    get_reg.side_effect = side_effects
-    expected_calls = [
-        mocker.call(test_device, as3935.AS3935_Sensor._TRCO_CALIB),
-        mocker.call(test_device, as3935.AS3935_Sensor._SRCO_CALIB),
-    ]
+    read_bytes.return_value = bytearray(side_effects)
     with pytest.raises(RuntimeError):
         test_device._check_clock_calibration()
-    assert get_reg.call_args_list == expected_calls
+    read_bytes.assert_called_once_with(test_device, as3935.AS3935_Sensor._TRCO_CALIB, 2)
 
 
 def test_check_clock_calibration_raises_exception_for_timeout(
-    mocker, set_reg, get_reg, test_device
+    mocker, read_bytes, test_device
 ):
     # This tests that a TimeoutError is raised if the calibration isn't complete after 1 second.
-    get_reg.return_value = 0
+    read_bytes.return_value = bytearray(2)
     # Return times for start, 1 second after start and then a bit more.
     mock_monotonic = mocker.patch.object(
         as3935.time, "monotonic", side_effect=[1000, 1001, 1001.01]
@@ -614,6 +908,8 @@ def test_reset(test_device, set_reg):
     set_reg.assert_called_once_with(
         test_device, as3935.AS3935_Sensor._PRESET_DEFAULT, 0x96
     )
+    # The reset powers up the sensor
+    assert test_device._pwd_state is False
 
 
 @pytest.mark.parametrize(
@@ -628,6 +924,41 @@ def test_interrupt_set(
     assert test_device.interrupt_set is return_value
 
 
+def test_interrupt_set_records_when_the_pin_goes_high(mocker, get_reg, test_device):
+    mock_pin_value = PropertyMock(return_value=False)
+    type(test_device._interrupt_pin).value = mock_pin_value
+    mocker.patch.object(
+        as3935.time, "monotonic_ns", side_effect=[1_000_000_000, 1_001_000_000]
+    )
+    get_reg.return_value = 0x00
+    assert test_device._int_pin_rise_time is None
+    test_device.interrupt_set
+    assert test_device._int_pin_rise_time is None
+    # The time is recorded the first time the pin is seen high
+    mock_pin_value.return_value = True
+    test_device.interrupt_set
+    test_device.interrupt_set
+    assert test_device._int_pin_rise_time == 1_000_000_000
+    # The time is cleared once the pin is low again
+    mock_pin_value.return_value = False
+    test_device.interrupt_set
+    assert test_device._int_pin_rise_time is None
+
+
+def test_interrupt_status_waits_the_full_delay_without_monotonic_ns(
+    mocker, monkeypatch, get_reg, test_device
+):
+    # Only the reduced precision float clock is available, so the rise isn't timed
+    monkeypatch.delattr(as3935.time, "monotonic_ns", raising=False)
+    mock_sleep = mocker.patch.object(as3935.time, "sleep")
+    type(test_device._interrupt_pin).value = PropertyMock(return_value=True)
+    get_reg.return_value = 0x00
+    assert test_device.interrupt_set is True
+    assert test_device._int_pin_rise_time is None
+    test_device.interrupt_status
+    mock_sleep.assert_called_once_with(0.0002)
+
+
 def test_startup_checks(mocker):
     mock_init = mocker.patch.object(as3935.AS3935_Sensor, "__init__", return_value=None)
     mock_reset = mocker.patch.object(
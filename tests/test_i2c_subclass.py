@@ -35,8 +35,16 @@ def test_as3935_AS3935_I2C_instantiated_with_correct_args(
     mock_i2cdevice.assert_called_once_with(i2c, 0x03)
     # Confirm that the I2CDevice is assighed to self._bus
     assert test_as3935_i2c._bus == i2cbus
+    # Check that the instance has its own buffers for bus transactions
+    assert isinstance(test_as3935_i2c._buffer, bytearray)
+    assert len(test_as3935_i2c._buffer) == 2
+    assert isinstance(test_as3935_i2c._burst_buffer, bytearray)
+    assert len(test_as3935_i2c._burst_buffer) == 5
     # Check that AS3935 instantiated with correct args
     mock_as3935_init.assert_called_once_with(test_as3935_i2c, interrupt_pin=int_pin)
+    # Check that buffers are not shared between instances
+    other_as3935_i2c = as3935.AS3935_I2C(i2c, interrupt_pin=int_pin)
+    assert other_as3935_i2c._buffer is not test_as3935_i2c._buffer
 
 
 @pytest.mark.parametrize("addr, data_byte", [(0x04, 0xFF), (0x0E, 0x44)])
@@ -54,12 +62,12 @@ def test_write_byte_out_calls_i2c_dev_write_with_correct_kwargs(
     mock_i2cdevice = mocker.patch.object(
         as3935.i2c_dev, "I2CDevice", autospec=True, return_value=mocker.MagicMock()
     )
-    test_register = as3935._Register(addr, 0x55, 0x00)
+    test_register = as3935._make_register(addr, 0x55, 0x00)
     test_as3935_i2c = as3935.AS3935_I2C("i2c", interrupt_pin="int_pin")
     test_as3935_i2c._write_byte_out(test_register, data_byte)
     name, args, kwargs = test_as3935_i2c._bus.__enter__.return_value.mock_calls[0]
     assert name == "write"
-    assert args == (as3935._BUFFER,)
+    assert args == (test_as3935_i2c._buffer,)
     assert kwargs == {"end": 2}
     mock_sleep.assert_called_once_with(0.01)
 
@@ -77,12 +85,71 @@ def test_read_byte_in_calls_i2c_dev_write_then_readinto_with_correct_args(
     mock_i2cdevice = mocker.patch.object(
         as3935.i2c_dev, "I2CDevice", autospec=True, return_value=mocker.MagicMock()
     )
-    test_register = as3935._Register(addr, 0x55, 0x00)
+    test_register = as3935._make_register(addr, 0x55, 0x00)
     test_as3935_i2c = as3935.AS3935_I2C("i2c", interrupt_pin="int_pin")
-    as3935._BUFFER[0] = data_byte
+    test_as3935_i2c._buffer[0] = data_byte
     assert test_as3935_i2c._read_byte_in(test_register) == addr
     name, args, kwargs = test_as3935_i2c._bus.__enter__.return_value.mock_calls[0]
     assert name == "write_then_readinto"
-    assert args == (as3935._BUFFER, as3935._BUFFER)
+    assert args == (test_as3935_i2c._buffer, test_as3935_i2c._buffer)
     assert kwargs == {"in_end": 1, "out_end": 1}
     mock_sleep.assert_called_once_with(0.01)
+
+
+@pytest.mark.parametrize("addr, count", [(0x04, 3), (0x3A, 2)])
+def test_read_bytes_in_calls_i2c_dev_write_then_readinto_with_correct_args(
+    mocker, addr, count
+):
+    mock_sleep = mocker.patch.object(as3935.time, "sleep", autospec=True)
+    mock_as3935_init = mocker.patch.object(
+        as3935.AS3935_Sensor, "__init__", return_value=None
+    )
+    mock_i2cdevice = mocker.patch.object(
+        as3935.i2c_dev, "I2CDevice", autospec=True, return_value=mocker.MagicMock()
+    )
+    test_register = as3935._make_register(addr, 0x55, 0x00)
+    test_as3935_i2c = as3935.AS3935_I2C("i2c", interrupt_pin="int_pin")
+    assert (
+        test_as3935_i2c._read_bytes_in(test_register, count)
+        is test_as3935_i2c._burst_buffer
+    )
+    assert test_as3935_i2c._buffer[0] == addr
+    name, args, kwargs = test_as3935_i2c._bus.__enter__.return_value.mock_calls[0]
+    assert name == "write_then_readinto"
+    assert args == (test_as3935_i2c._buffer, test_as3935_i2c._burst_buffer)
+    assert kwargs == {"in_end": count, "out_end": 1}
+    mock_sleep.assert_called_once_with(0.01)
+
+
+@pytest.mark.parametrize(
+    "method, args, transfers",
+    [
+        ("_set_register", (as3935._make_register(0x01, 0x04, 0x70), 0x02), 2),
+        (
+            "_pulse_bit",
+            (as3935._make_register(0x02, 0x06, 0x40), (0x40, 0x00, 0x40)),
+            4,
+        ),
+    ],
+)
+def test_register_updates_pause_before_each_transfer(mocker, method, args, transfers):
+    mocker.patch.object(as3935.AS3935_Sensor, "__init__", return_value=None)
+    manager = mocker.MagicMock()
+    manager.attach_mock(
+        mocker.patch.object(as3935.time, "sleep", autospec=True), "sleep"
+    )
+    mocker.patch.object(as3935.i2c_dev, "I2CDevice", return_value=manager.bus)
+    test_device = as3935.AS3935_I2C("i2c", interrupt_pin="int_pin")
+    test_device._reg_cache = {}
+    getattr(test_device, method)(*args)
+    # The AS3935 needs its transfers spaced out, and the bus is released between them
+    calls = [
+        call
+        for call in manager.mock_calls
+        if call[0] in ("sleep", "bus.__enter__", "bus.__exit__")
+    ]
+    assert [call[0] for call in calls] == [
+        "sleep",
+        "bus.__enter__",
+        "bus.__exit__",
+    ] * transfers
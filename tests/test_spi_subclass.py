@@ -62,8 +62,18 @@ def test_as3935_instantiated_with_correct_args_from_as3935_spi(
     )
     # Check that self._bus is correctly assigned
     assert test_as3935._bus == spibus
+    # Check that the instance has its own buffers for bus transactions
+    assert isinstance(test_as3935._buffer, bytearray)
+    assert len(test_as3935._buffer) == 2
+    assert isinstance(test_as3935._read_buffer, bytearray)
+    assert len(test_as3935._read_buffer) == 2
+    assert isinstance(test_as3935._burst_buffer, bytearray)
+    assert len(test_as3935._burst_buffer) == 5
     # Check that AS3935 instantiated with correct args
     mock_as3935_init.assert_called_once_with(test_as3935, interrupt_pin=int_pin)
+    # Check that buffers are not shared between instances
+    other_as3935 = as3935.AS3935(spi, mock_cs_pin, interrupt_pin=int_pin)
+    assert other_as3935._buffer is not test_as3935._buffer
 
 
 @pytest.mark.parametrize(
@@ -81,14 +91,17 @@ def test_write_byte_out_sets_correct_bits_for_write_address_and_sends_correect_d
     mock_spidevice = mocker.patch.object(
         as3935.spi_dev, "SPIDevice", autospec=True, return_value=mocker.MagicMock()
     )
-    test_register = as3935._Register(addr, 0x55, 0x00)
+    test_register = as3935._make_register(addr, 0x55, 0x00)
     test_as3935_spi = as3935.AS3935("spi", "cs_pin", interrupt_pin="int_pin")
     test_as3935_spi._write_byte_out(test_register, data_byte)
     # Check that SPIDevice.write is called with the write bits set in the register address
-    assert as3935._BUFFER[0] == buffer
+    assert test_as3935_spi._buffer[0] == buffer
+    assert test_as3935_spi._buffer[1] == data_byte
+    # Confirm that the address and data are sent in a single transfer
+    assert len(test_as3935_spi._bus.__enter__.return_value.mock_calls) == 1
     name, args, kwargs = test_as3935_spi._bus.__enter__.return_value.mock_calls[0]
     assert name == "write"
-    assert args == (as3935._BUFFER,)
+    assert args == (test_as3935_spi._buffer,)
     assert kwargs == {"end": 2}
     mock_sleep.assert_called_once_with(0.01)
 
@@ -108,13 +121,154 @@ def test_read_byte_in_sets_correct_bits_for_read_address_and_sends_correect_data
     mock_spidevice = mocker.patch.object(
         as3935.spi_dev, "SPIDevice", autospec=True, return_value=mocker.MagicMock()
     )
-    test_register = as3935._Register(addr, 0x55, 0x00)
+    test_register = as3935._make_register(addr, 0x55, 0x00)
     test_as3935_spi = as3935.AS3935("spi", "cs_pin", interrupt_pin="int_pin")
-    test_as3935_spi._read_byte_in(test_register)
+    test_as3935_spi._read_buffer[1] = data_byte
+    assert test_as3935_spi._read_byte_in(test_register) == data_byte
+    # Confirm that the address is sent and the data read back in a single transfer
+    assert len(test_as3935_spi._bus.__enter__.return_value.mock_calls) == 1
+    name, args, kwargs = test_as3935_spi._bus.__enter__.return_value.mock_calls[0]
+    assert name == "write_readinto"
+    assert args == (test_as3935_spi._buffer, test_as3935_spi._read_buffer)
+    assert test_as3935_spi._buffer[0] == buffer
+    assert test_as3935_spi._buffer[1] == 0x00
+    mock_sleep.assert_called_once_with(0.01)
+
+
+@pytest.mark.parametrize(
+    "addr, count, buffer",
+    [(0x04, 3, 0x44), (0x3A, 2, 0x7A)],
+)
+def test_read_bytes_in_reads_consecutive_registers_in_one_transaction(
+    mocker, addr, count, buffer
+):
+    mock_sleep = mocker.patch.object(as3935.time, "sleep", autospec=True)
+    mocker.patch.object(as3935.digitalio, "DigitalInOut")
+    mock_as3935_init = mocker.patch.object(
+        as3935.AS3935_Sensor, "__init__", return_value=None
+    )
+    mock_spidevice = mocker.patch.object(
+        as3935.spi_dev, "SPIDevice", autospec=True, return_value=mocker.MagicMock()
+    )
+    test_register = as3935._make_register(addr, 0x55, 0x00)
+    test_as3935_spi = as3935.AS3935("spi", "cs_pin", interrupt_pin="int_pin")
+    assert (
+        test_as3935_spi._read_bytes_in(test_register, count)
+        is test_as3935_spi._burst_buffer
+    )
+    # Confirm the bus is only entered once, so CS is held for the whole burst
+    test_as3935_spi._bus.__enter__.assert_called_once()
+    assert test_as3935_spi._buffer[0] == buffer
     name, args, kwargs = test_as3935_spi._bus.__enter__.return_value.mock_calls[0]
     assert name == "write"
     assert kwargs == {"end": 1}
-    name, _, kwargs = test_as3935_spi._bus.__enter__.return_value.mock_calls[1]
+    name, args, kwargs = test_as3935_spi._bus.__enter__.return_value.mock_calls[1]
     assert name == "readinto"
-    assert kwargs == {"end": 1}
+    assert args == (test_as3935_spi._burst_buffer,)
+    assert kwargs == {"end": count}
     mock_sleep.assert_called_once_with(0.01)
+
+
+@pytest.mark.parametrize(
+    "method, args",
+    [("_write_byte_out", (0x55,)), ("_read_byte_in", ()), ("_read_bytes_in", (3,))],
+)
+def test_bus_pause_is_taken_before_the_bus_is_locked(mocker, method, args):
+    mocker.patch.object(as3935.digitalio, "DigitalInOut")
+    mocker.patch.object(as3935.AS3935_Sensor, "__init__", return_value=None)
+    manager = mocker.MagicMock()
+    manager.attach_mock(
+        mocker.patch.object(as3935.time, "sleep", autospec=True), "sleep"
+    )
+    mocker.patch.object(as3935.spi_dev, "SPIDevice", return_value=manager.bus)
+    test_as3935_spi = as3935.AS3935("spi", "cs_pin", interrupt_pin="int_pin")
+    getattr(test_as3935_spi, method)(as3935._make_register(0x04, 0x00, 0xFF), *args)
+    # CS is asserted when the bus is entered, so don't hold it through the pause
+    assert manager.mock_calls[:2] == [
+        mocker.call.sleep(0.01),
+        mocker.call.bus.__enter__(),
+    ]
+
+
+def test_as3935_uses_exclusive_spi_device_when_requested(mocker):
+    mocker.patch.object(as3935.digitalio, "DigitalInOut", return_value="cs_pin_out")
+    mock_spidevice = mocker.patch.object(as3935.spi_dev, "SPIDevice")
+    mock_exclusive = mocker.patch.object(
+        as3935, "_ExclusiveSPIDevice", return_value="exclusive_bus"
+    )
+    mocker.patch.object(as3935.AS3935_Sensor, "__init__", return_value=None)
+    test_as3935_spi = as3935.AS3935(
+        "spi", "cs_pin", interrupt_pin="int_pin", exclusive_bus=True
+    )
+    mock_spidevice.assert_not_called()
+    mock_exclusive.assert_called_once_with(
+        "spi", "cs_pin_out", baudrate=1_000_000, polarity=1, phase=0
+    )
+    assert test_as3935_spi._bus == "exclusive_bus"
+
+
+def test_exclusive_spi_device_only_configures_the_bus_when_needed(mocker):
+    mock_spi = mocker.Mock()
+    mock_spi.try_lock.side_effect = [False, True, True, True]
+    mock_cs = mocker.Mock()
+    mocker.patch.object(as3935._ExclusiveSPIDevice, "_owner", None)
+    mocker.patch.object(as3935.time, "sleep")
+    device = as3935._ExclusiveSPIDevice(
+        mock_spi, mock_cs, baudrate=1_000_000, polarity=1, phase=0
+    )
+    # CS is set up as an output and deselected
+    mock_cs.switch_to_output.assert_called_once_with(value=True)
+    # The bus is configured on first use, waiting for the lock if necessary
+    with device as spi:
+        assert spi is mock_spi
+        assert mock_cs.value is False
+    assert mock_cs.value is True
+    mock_spi.configure.assert_called_once_with(baudrate=1_000_000, polarity=1, phase=0)
+    mock_spi.unlock.assert_called_once()
+    # It isn't configured again while no other AS3935 has used the bus
+    with device:
+        pass
+    mock_spi.configure.assert_called_once()
+    # Another AS3935 on the same bus configures it again
+    other_device = as3935._ExclusiveSPIDevice(
+        mock_spi, mock_cs, baudrate=2_000_000, polarity=1, phase=0
+    )
+    with other_device:
+        pass
+    assert mock_spi.configure.call_count == 2
+    assert mock_spi.unlock.call_count == 3
+
+
+@pytest.mark.parametrize(
+    "method, args, transfers",
+    [
+        ("_set_register", (as3935._make_register(0x01, 0x04, 0x70), 0x02), 2),
+        (
+            "_pulse_bit",
+            (as3935._make_register(0x02, 0x06, 0x40), (0x40, 0x00, 0x40)),
+            4,
+        ),
+    ],
+)
+def test_register_updates_pause_before_each_transfer(mocker, method, args, transfers):
+    mocker.patch.object(as3935.AS3935_Sensor, "__init__", return_value=None)
+    manager = mocker.MagicMock()
+    manager.attach_mock(
+        mocker.patch.object(as3935.time, "sleep", autospec=True), "sleep"
+    )
+    mocker.patch.object(as3935.digitalio, "DigitalInOut")
+    mocker.patch.object(as3935.spi_dev, "SPIDevice", return_value=manager.bus)
+    test_device = as3935.AS3935("spi", "cs_pin", interrupt_pin="int_pin")
+    test_device._reg_cache = {}
+    getattr(test_device, method)(*args)
+    # The AS3935 needs its transfers spaced out, and the bus is released between them
+    calls = [
+        call
+        for call in manager.mock_calls
+        if call[0] in ("sleep", "bus.__enter__", "bus.__exit__")
+    ]
+    assert [call[0] for call in calls] == [
+        "sleep",
+        "bus.__enter__",
+        "bus.__exit__",
+    ] * transfers